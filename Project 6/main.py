@@ -10,76 +10,180 @@ import curses
 from curses import wrapper
 import time
 import random
-from typing import List, Tuple, Optional
+from typing import NamedTuple, Sequence, Tuple, Optional
 
 
-def load_text() -> List[str]:
+# How long a finished round stays on screen unless a key is pressed first
+COMPLETION_PAUSE_MS = 300
+
+# Standard WPM: 5 characters = 1 word, per minute -> chars * (60 / 5) / seconds
+WPM_FACTOR = 60.0 / 5.0
+
+# Common English words for typing practice
+WORDS = (
+    "the", "be", "to", "of", "and", "a", "in", "that", "have", "I",
+    "it", "for", "not", "on", "with", "he", "as", "you", "do", "at",
+    "this", "but", "his", "by", "from", "they", "we", "say", "her", "she",
+    "or", "an", "will", "my", "one", "all", "would", "there", "their", "what",
+    "so", "up", "out", "if", "about", "who", "get", "which", "go", "me",
+    "when", "make", "can", "like", "time", "no", "just", "him", "know", "take",
+    "people", "into", "year", "your", "good", "some", "could", "them", "see", "other",
+    "than", "then", "now", "look", "only", "come", "its", "over", "think", "also",
+    "back", "after", "use", "two", "how", "our", "work", "first", "well", "way",
+    "even", "new", "want", "because", "any", "these", "give", "day", "most", "us",
+    "is", "are", "was", "were", "had", "has", "it's", "been", "being", "am"
+)
+
+
+class Geometry(NamedTuple):
     """
-    Load a list of words for the typing test.
+    Screen positions for a round, computed once instead of on every render.
     
-    Returns:
-        List[str]: A list of common English words for typing practice
+    Attributes:
+        h: Screen height when the geometry was computed
+        w: Screen width when the geometry was computed
+        start_x: Column where the target text starts
+        start_y: Row of the target text
+        visible_len: Number of target characters that fit on screen
     """
-    words = [
-        "the", "be", "to", "of", "and", "a", "in", "that", "have", "I",
-        "it", "for", "not", "on", "with", "he", "as", "you", "do", "at",
-        "this", "but", "his", "by", "from", "they", "we", "say", "her", "she",
-        "or", "an", "will", "my", "one", "all", "would", "there", "their", "what",
-        "so", "up", "out", "if", "about", "who", "get", "which", "go", "me",
-        "when", "make", "can", "like", "time", "no", "just", "him", "know", "take",
-        "people", "into", "year", "your", "good", "some", "could", "them", "see", "other",
-        "than", "then", "now", "look", "only", "come", "its", "over", "think", "also",
-        "back", "after", "use", "two", "how", "our", "work", "first", "well", "way",
-        "even", "new", "want", "because", "any", "these", "give", "day", "most", "us",
-        "is", "are", "was", "were", "had", "has", "it's", "been", "being", "am"
-    ]
-    return words
+    h: int
+    w: int
+    start_x: int
+    start_y: int
+    visible_len: int
 
 
-def display_text(stdscr: 'curses._CursesWindow', target_text: str, current_text: str, wpm: float = 0.0) -> None:
+def get_geometry(stdscr: 'curses._CursesWindow', target_text: str) -> Geometry:
     """
-    Display the target text, user's current input, and WPM on the screen.
+    Compute the centered layout of the target text for the current screen size.
     
     Args:
         stdscr: The curses window object
         target_text: The text the user needs to type
-        current_text: The text the user has typed so far
-        wpm: Current words per minute speed
+        
+    Returns:
+        Geometry: The cached screen positions for this round
     """
-    stdscr.clear()
     h, w = stdscr.getmaxyx()
     
     # Calculate center position for text
     start_x = max(0, w // 2 - len(target_text) // 2)
     start_y = h // 2
+    visible_len = max(0, min(len(target_text), w - 1 - start_x))
+    return Geometry(h, w, start_x, start_y, visible_len)
+
+
+def draw_static(stdscr: 'curses._CursesWindow', geom: Geometry, target_text: str, wpm: float = 0.0) -> None:
+    """
+    Draw the instructions, WPM stats and untyped target text for a new round.
+    
+    Args:
+        stdscr: The curses window object
+        geom: Screen positions for the current round
+        target_text: The text the user needs to type
+        wpm: Current words per minute speed
+    """
+    stdscr.clear()
     
     # Display instructions
     instructions = "Type the text below. Press ESC to exit."
-    stdscr.addstr(start_y - 3, max(0, w // 2 - len(instructions) // 2), instructions)
+    stdscr.addstr(geom.start_y - 3, max(0, geom.w // 2 - len(instructions) // 2), instructions)
     
     # Display stats
-    stats = f"WPM: {wpm:.2f}"
-    stdscr.addstr(start_y - 1, max(0, w // 2 - len(stats) // 2), stats)
+    display_stats(stdscr, geom, wpm)
     
     # Display target text
-    stdscr.addstr(start_y, start_x, target_text)
+    stdscr.addstr(geom.start_y, geom.start_x, target_text)
     
-    # Display user's typing with color-coded feedback
-    for i, char in enumerate(current_text):
-        # Stay within bounds
-        if i >= len(target_text) or start_x + i >= w - 1:
-            break
-            
-        # Set color based on correctness
-        if i < len(target_text):
-            if char == target_text[i]:
-                color = curses.color_pair(1)  # Green for correct
-            else:
-                color = curses.color_pair(2)  # Red for incorrect
-            
-            stdscr.addstr(start_y, start_x + i, char, color)
+    stdscr.noutrefresh()
+
+
+def erase_typed(stdscr: 'curses._CursesWindow', geom: Geometry, target_text: str, start: int, end: int) -> None:
+    """
+    Restore untyped target characters after a backspace.
     
-    stdscr.refresh()
+    Args:
+        stdscr: The curses window object
+        geom: Screen positions for the current round
+        target_text: The text the user needs to type
+        start: Index of the first character to restore
+        end: Index just past the last character to restore
+    """
+    end = min(end, geom.visible_len)
+    if start >= end:
+        return
+    
+    stdscr.addstr(geom.start_y, geom.start_x + start, target_text[start:end])
+    stdscr.noutrefresh()
+
+
+def draw_typed(stdscr: 'curses._CursesWindow', geom: Geometry, target_bytes: bytes, typed: bytearray, green: int, red: int, start: int = 0) -> None:
+    """
+    Paint typed text in runs of same-colored characters.
+    
+    Instead of one curses call per character, consecutive characters that are
+    all correct (or all incorrect) are written with a single addstr call.
+    
+    Args:
+        stdscr: The curses window object
+        geom: Screen positions for the current round
+        target_bytes: The ASCII-encoded text the user needs to type
+        typed: The keys the user has typed so far
+        green: Curses attribute for correct characters
+        red: Curses attribute for incorrect characters
+        start: Index of the first character to repaint
+    """
+    end = min(len(typed), geom.visible_len)
+    if start >= end:
+        return
+    
+    run_start = start
+    while run_start < end:
+        # Extend the run while correctness stays the same
+        correct = typed[run_start] == target_bytes[run_start]
+        run_end = run_start + 1
+        while run_end < end and (typed[run_end] == target_bytes[run_end]) == correct:
+            run_end += 1
+        
+        stdscr.addstr(geom.start_y, geom.start_x + run_start,
+                      typed[run_start:run_end].decode("ascii"), green if correct else red)
+        run_start = run_end
+    
+    stdscr.noutrefresh()
+
+
+def display_stats(stdscr: 'curses._CursesWindow', geom: Geometry, wpm: float) -> None:
+    """
+    Redraw only the WPM stats line, leaving the target text untouched.
+    
+    Args:
+        stdscr: The curses window object
+        geom: Screen positions for the current round
+        wpm: Current words per minute speed
+    """
+    stats = f"WPM: {wpm:.2f}"
+    stdscr.move(geom.start_y - 1, 0)
+    stdscr.clrtoeol()
+    stdscr.addstr(geom.start_y - 1, max(0, geom.w // 2 - len(stats) // 2), stats)
+    stdscr.noutrefresh()
+
+
+def read_key(stdscr: 'curses._CursesWindow') -> int:
+    """
+    Read a key, treating a curses error as "no key pressed".
+    
+    Only curses.error is caught, so KeyboardInterrupt still propagates.
+    
+    Args:
+        stdscr: The curses window object
+        
+    Returns:
+        int: The key code, or -1 if no key was available
+    """
+    try:
+        return stdscr.getch()
+    except curses.error:
+        return -1
 
 
 def calculate_wpm(start_time: float, end_time: float, typed_chars: int) -> float:
@@ -87,33 +191,34 @@ def calculate_wpm(start_time: float, end_time: float, typed_chars: int) -> float
     Calculate words per minute based on typing duration and character count.
     
     Args:
-        start_time: The time when typing started (in seconds)
-        end_time: The time when typing ended (in seconds)
+        start_time: The time when typing started (monotonic clock, in seconds)
+        end_time: The time when typing ended (monotonic clock, in seconds)
         typed_chars: Number of characters typed
         
     Returns:
         float: The calculated WPM
     """
-    # Standard calculation: 5 characters = 1 word, convert to minutes
-    elapsed_time = max(0.001, end_time - start_time)  # Avoid division by zero
-    words = typed_chars / 5
-    minutes = elapsed_time / 60
-    return words / minutes if minutes > 0 else 0
+    elapsed_time = end_time - start_time
+    if elapsed_time < 0.001:  # Avoid division by zero
+        elapsed_time = 0.001
+    return typed_chars * WPM_FACTOR / elapsed_time
 
 
-def generate_target_text(word_list: List[str], word_count: int = 10) -> str:
+def generate_target_text(word_list: Sequence[str], word_count: int = 10) -> str:
     """
     Generate a random string of words for the typing test.
     
+    Words may repeat, which is fine for typing practice and cheaper than
+    sampling without replacement.
+    
     Args:
-        word_list: List of words to choose from
+        word_list: Words to choose from
         word_count: Number of words to include
         
     Returns:
         str: Space-separated string of random words
     """
-    selected_words = random.sample(word_list, min(word_count, len(word_list)))
-    return " ".join(selected_words)
+    return " ".join(random.choices(word_list, k=word_count))
 
 
 def run_typing_test(stdscr: 'curses._CursesWindow') -> Tuple[float, float]:
@@ -126,76 +231,144 @@ def run_typing_test(stdscr: 'curses._CursesWindow') -> Tuple[float, float]:
     Returns:
         Tuple[float, float]: A tuple containing (WPM, accuracy percentage)
     """
+    # Bind the clock locally; monotonic time is unaffected by wall-clock jumps
+    now = time.monotonic
+    
     # Initialize colors
     curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)
     curses.init_pair(2, curses.COLOR_RED, curses.COLOR_BLACK)
+    green = curses.color_pair(1)  # Correct characters
+    red = curses.color_pair(2)  # Incorrect characters
     
-    # Prepare words and initial display
-    words = load_text()
-    target_text = generate_target_text(words)
-    current_text = ""
+    # Prepare words and initial display; the next round's text is generated
+    # ahead of time so a finished round can switch over immediately
+    target_text = generate_target_text(WORDS)
+    next_text = generate_target_text(WORDS)
+    target_bytes = target_text.encode("ascii")
+    target_len = len(target_bytes)
+    geom = get_geometry(stdscr, target_text)
+    current_text = bytearray()  # Typed keys are printable ASCII, so bytes suffice
     wpm = 0.0
     
     # Track typing statistics
-    start_time = time.time()
+    start_time = now()
     total_correct_chars = 0
     total_chars = 0
     
     # Display initial screen
-    display_text(stdscr, target_text, current_text, wpm)
+    draw_static(stdscr, geom, target_text, wpm)
+    curses.doupdate()
+    
+    # Wake up ten times a second so the WPM keeps updating while the user pauses
+    stdscr.timeout(100)
+    last_wpm_time = start_time
     
     while True:
-        # Calculate and display current WPM
-        if current_text:
-            current_time = time.time()
-            wpm = calculate_wpm(start_time, current_time, len(current_text))
+        # Get user input; -1 means an idle tick
+        key = read_key(stdscr)
         
-        # Update display
-        display_text(stdscr, target_text, current_text, wpm)
+        # Typed text on screen before this batch, and the first index to repaint
+        drawn_len = len(current_text)
+        dirty_start = drawn_len
+        exiting = False
+        resized = False
         
-        # Get user input
-        try:
-            key = stdscr.getch()
-        except:
-            continue
+        # Drain every key already queued (paste, fast typing) before rendering once
+        changed = key != -1
+        if changed:
+            stdscr.nodelay(True)
+        while key != -1:
+            # Handle key input
+            if key == 27:  # ESC
+                exiting = True
+                break
+            elif key == curses.KEY_RESIZE:
+                resized = True
+            elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
+                if current_text:
+                    del current_text[-1:]
+                    dirty_start = min(dirty_start, len(current_text))
+            elif 32 <= key <= 126:  # Printable ASCII characters
+                idx = len(current_text)
+                current_text.append(key)
+                total_chars += 1
+                
+                # Decide correctness once per keystroke for the accuracy count
+                correct = idx < target_len and key == target_bytes[idx]
+                total_correct_chars += correct
+            
+            # Stop draining once the round is complete
+            if len(current_text) >= target_len:
+                break
+            key = read_key(stdscr)
         
-        # Handle key input
-        if key == 27:  # ESC
+        if exiting:
             break
-        elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
-            if current_text:
-                current_text = current_text[:-1]
-        elif 32 <= key <= 126:  # Printable ASCII characters
-            char = chr(key)
-            current_text += char
-            total_chars += 1
-            
-            # Check if character is correct
-            if len(current_text) <= len(target_text) and char == target_text[len(current_text) - 1]:
-                total_correct_chars += 1
+        if changed:
+            stdscr.timeout(100)
+        
+        # Re-center everything if the terminal size actually changed
+        if resized and stdscr.getmaxyx() != (geom.h, geom.w):
+            geom = get_geometry(stdscr, target_text)
+            draw_static(stdscr, geom, target_text, wpm)
+            draw_typed(stdscr, geom, target_bytes, current_text, green, red)
+        else:
+            # Repaint only what changed during this batch
+            erase_typed(stdscr, geom, target_text, len(current_text), drawn_len)
+            draw_typed(stdscr, geom, target_bytes, current_text, green, red, dirty_start)
+        
+        # Refresh the WPM at most ten times a second
+        tick = now()
+        if current_text and tick - last_wpm_time >= 0.1:
+            elapsed = tick - start_time
+            if elapsed < 0.001:  # Same guard as calculate_wpm
+                elapsed = 0.001
+            wpm = len(current_text) * WPM_FACTOR / elapsed
+            display_stats(stdscr, geom, wpm)
+            last_wpm_time = tick
+            changed = True
+        
+        # Commit all staged output to the terminal in one go
+        if changed:
+            curses.doupdate()
         
         # Check if test is complete
-        if len(current_text) >= len(target_text):
-            # Short pause to show completion
-            display_text(stdscr, target_text, current_text, wpm)
-            stdscr.timeout(1500)
-            stdscr.getch()
-            stdscr.timeout(-1)
+        if len(current_text) >= target_len:
+            # Briefly show the completed line; a keypress ends the pause early
+            # and is pushed back so it counts towards the next round
+            stdscr.timeout(COMPLETION_PAUSE_MS)
+            key = read_key(stdscr)
+            if key != -1:
+                curses.ungetch(key)
+            stdscr.timeout(100)
             
             # Calculate final statistics
-            end_time = time.time()
+            end_time = now()
             final_wpm = calculate_wpm(start_time, end_time, total_chars)
             accuracy = (total_correct_chars / total_chars) * 100 if total_chars > 0 else 0
             
-            # Generate new text for continued typing
-            target_text = generate_target_text(words)
-            current_text = ""
-            start_time = time.time()
+            # Swap in the pre-generated text for continued typing
+            target_text = next_text
+            target_bytes = target_text.encode("ascii")
+            target_len = len(target_bytes)
+            geom = get_geometry(stdscr, target_text)
+            current_text = bytearray()
+            start_time = now()
+            last_wpm_time = start_time
             total_correct_chars = 0
             total_chars = 0
+            wpm = 0.0
+            draw_static(stdscr, geom, target_text, wpm)
+            curses.doupdate()
+            
+            # Prepare the following round once the new one is on screen
+            next_text = generate_target_text(WORDS)
+    
+    # Restore blocking input for the results screen
+    stdscr.timeout(-1)
     
     # Calculate final statistics
-    end_time = time.time()
+    end_time = now()
     final_wpm = calculate_wpm(start_time, end_time, total_chars)
     accuracy = (total_correct_chars / total_chars) * 100 if total_chars > 0 else 0
     